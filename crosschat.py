@@ -1,5 +1,11 @@
 from typing import Union, Optional, Any, Coroutine
-import random
+from collections import deque
+from dataclasses import dataclass
+import functools
+import itertools
+import operator
+import reprlib
+import sys
 import time
 import asyncio
 import threading
@@ -8,17 +14,50 @@ import logging
 from rich import print
 
 
-def override(func):
-    """
-    A decorator to indicate that a method should be overridden in a child class.
+_EMPTY: dict = {}
 
-    Args:
-        func (function): The function to be decorated.
+_repr = reprlib.Repr()
+_repr.maxlist = 10
+_repr.maxdict = 10
+_repr.maxdeque = 10
+_repr.maxstring = 80
 
-    Returns:
-        function: The original function.
-    """
-    return func
+_CROSSCHAT_REPR = "CrossChat(n_channels=%d, n_users=%d, n_messages=%d, platforms=%s)"
+_PLATFORM_REPR = "Platform(name=%s)"
+_CHANNEL_REPR = "Channel(name=%s, ids=%s)"
+_USER_REPR = "User(display_name=%s, username=%s)"
+_ATTACHMENT_REPR = "Attachment(file_url=%s)"
+_ORIGINALMESSAGE_REPR = (
+    "OriginalMessage(content=%s, id=%s, platform=%s, user=%s, channel=%s)"
+)
+_MESSAGE_REPR = "Message(channel=%s, user=%s, content=%s, ids=%s, originalMessageId=%s)"
+
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from typing import override
+except ImportError:  # Python < 3.12
+
+    def override(func):
+        """
+        A decorator to indicate that a method should be overridden in a child class.
+
+        Args:
+            func (function): The function to be decorated.
+
+        Returns:
+            function: The original function.
+        """
+        return func
 
 
 class CrossChat:
@@ -26,24 +65,55 @@ class CrossChat:
     Manages communication across multiple platforms, channels, and users.
 
     Attributes:
-        channels (list[Channel]): List of channels in the system.
-        users (list[User]): List of users in the system.
+        channels (list[Channel]): Channels in the system (derived from the per-platform index).
+        users (dict[str, User]): Users in the system, keyed by username.
         platforms (dict[str, Platform]): Dictionary of platform names to Platform objects.
-        messages (list[Message]): List of messages in the system.
+        messages (deque[Message]): Messages in the system, in ingest order.
     """
 
+    __slots__ = (
+        "users",
+        "platforms",
+        "messages",
+        "_append_message",
+        "maxConcurrentWorkers",
+        "_platforms_tuple",
+        "_platform_names",
+        "_channel_index",
+        "channels_version",
+        "_user_index",
+        "_message_index",
+        "_get_platform_cached",
+        "_pending",
+        "_shared_connector",
+        "loop",
+        "thread",
+        "logger",
+        "tasks",
+    )
+
     def __init__(self):
         """
         Initializes the CrossChat instance with empty lists and dictionaries for channels, users, platforms, and messages.
         """
-        self.channels: list["Channel"] = []
-        self.users: list["User"] = []
+        self.users: dict[str, "User"] = {}
         self.platforms: dict[str, "Platform"] = {}
-        self.messages: list["Message"] = []
-        self.loop = asyncio.new_event_loop()
-        self.thread = threading.Thread(
-            target=self.loop.run_until_complete, args=(self.runner(),), daemon=True
+        self.messages: deque["Message"] = deque()
+        self._append_message = self.messages.append
+        self.maxConcurrentWorkers: int = 8
+        self._platforms_tuple: tuple["Platform", ...] = ()
+        self._platform_names: tuple[str, ...] = ()
+        self._channel_index: dict[str, dict[int, "Channel"]] = {}
+        self.channels_version: int = 0
+        self._user_index: dict[tuple[str, int], "User"] = {}
+        self._message_index: dict[tuple[str, int], "Message"] = {}
+        self._get_platform_cached = functools.lru_cache(maxsize=32)(self.platforms.get)
+        self._pending: dict[tuple[int, str, int], list["Message"]] = {}
+        self._shared_connector = None
+        self.loop = (
+            uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
         )
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
         asyncio.set_event_loop(self.loop)
         logging.basicConfig(
             format="%(name)s - %(message)s",
@@ -63,7 +133,16 @@ class CrossChat:
             name (str): The name of the platform.
             platform (Platform): The platform object to add.
         """
+        name = sys.intern(name)
+        platform.idx = len(self.platforms)
         self.platforms[name] = platform
+        self._platforms_tuple = tuple(self.platforms.values())
+        self._platform_names = tuple(self.platforms)
+        for registered in self._platforms_tuple:
+            registered._broadcast_targets = tuple(
+                other for other in self._platforms_tuple if other is not registered
+            )
+        self._get_platform_cached.cache_clear()
 
     def get_platform(self, name: str) -> Optional["Platform"]:
         """
@@ -84,7 +163,35 @@ class CrossChat:
         Returns:
             list[str]: List of platform names.
         """
-        return list(self.platforms.keys())
+        return list(self._platform_names)
+
+    def shared_connector(self):
+        """
+        Lazily creates one aiohttp.TCPConnector shared by every platform
+        that speaks HTTP over aiohttp, so keep-alive connections and the
+        DNS cache are pooled instead of duplicated per platform.
+
+        Returns:
+            Optional[aiohttp.TCPConnector]: The shared connector, or None
+            when aiohttp is not installed.
+        """
+        if aiohttp is None:
+            return None
+        if self._shared_connector is None or self._shared_connector.closed:
+            self._shared_connector = aiohttp.TCPConnector(
+                limit=100, limit_per_host=10, ttl_dns_cache=300, loop=self.loop
+            )
+        return self._shared_connector
+
+    def platform_names(self) -> tuple[str, ...]:
+        """
+        Retrieves the platform names as an immutable cached snapshot,
+        refreshed only when add_platform runs.
+
+        Returns:
+            tuple[str, ...]: The registered platform names, in insertion order.
+        """
+        return self._platform_names
 
     def add_channel(self, channel: "Channel") -> None:
         """
@@ -93,7 +200,23 @@ class CrossChat:
         Args:
             channel (Channel): The channel object to add.
         """
-        self.channels.append(channel)
+        for key, id in channel.ids.items():
+            self._channel_index.setdefault(key, {})[id] = channel
+        self.channels_version += 1
+
+    @property
+    def channels(self) -> list["Channel"]:
+        """
+        A flat view of every channel known to the per-platform index.
+
+        Returns:
+            list[Channel]: The channels in the system, deduplicated.
+        """
+        seen: dict[int, "Channel"] = {}
+        for sub_index in self._channel_index.values():
+            for channel in sub_index.values():
+                seen[id(channel)] = channel
+        return list(seen.values())
 
     def add_user(self, user: "User") -> None:
         """
@@ -102,7 +225,7 @@ class CrossChat:
         Args:
             user (User): The user object to add.
         """
-        self.users.append(user)
+        self.users[user.username] = user
 
     def add_message(self, message: "Message") -> None:
         """
@@ -111,7 +234,7 @@ class CrossChat:
         Args:
             message (Message): The message object to add.
         """
-        self.messages.append(message)
+        self._append_message(message)
 
     def get_channel(
         self, id: int, platform: Union[str, "Platform"]
@@ -127,26 +250,148 @@ class CrossChat:
             Optional[Channel]: The channel object if found, otherwise None.
         """
         key = platform if isinstance(platform, str) else platform.name
-        for channel in self.channels:
-            if channel.get_id(key) == id:
-                return channel
-        return None
+        return self._channel_index.get(key, _EMPTY).get(id)
+
+    def get_user(self, id: int, platform: Union[str, "Platform"]) -> Optional["User"]:
+        """
+        Retrieves a user by their ID and platform.
+
+        Args:
+            id (int): The ID of the user.
+            platform (Union[str, Platform]): The platform name or object.
+
+        Returns:
+            Optional[User]: The user object if found, otherwise None.
+        """
+        key = platform if isinstance(platform, str) else platform.name
+        return self._user_index.get((key, id))
 
-    def make_reply_str(self, reply: Optional["OriginalMessage"]) -> str:
+    def get_user_by_username(self, username: str) -> Optional["User"]:
+        """
+        Retrieves a user by their username.
+
+        Args:
+            username (str): The username of the user.
+
+        Returns:
+            Optional[User]: The user object if found, otherwise None.
+        """
+        return self.users.get(username)
+
+    def get_message(
+        self, id: int, platform: Union[str, "Platform"]
+    ) -> Optional["Message"]:
+        """
+        Retrieves a message by its ID and platform.
+
+        Args:
+            id (int): The ID of the message.
+            platform (Union[str, Platform]): The platform name or object.
+
+        Returns:
+            Optional[Message]: The message object if found, otherwise None.
+        """
+        key = platform if isinstance(platform, str) else platform.name
+        return self._message_index.get((key, id))
+
+    def find_message(
+        self, platform: Union[str, "Platform"], channel_id: int, message_id: int
+    ) -> Optional["Message"]:
+        """
+        Resolves a message from a platform's channel and message IDs.
+
+        Args:
+            platform (Union[str, Platform]): The platform name or object.
+            channel_id (int): The platform-specific channel ID.
+            message_id (int): The platform-specific message ID.
+
+        Returns:
+            Optional[Message]: The message object if found, otherwise None.
+        """
+        key = platform if isinstance(platform, str) else platform.name
+        channel = self._channel_index.get(key, _EMPTY).get(channel_id)
+        if channel is None:
+            return None
+        return channel.messages.get(key, _EMPTY).get(message_id)
+
+    async def broadcast_many(self, messages: list["Message"]) -> None:
+        """
+        Broadcasts several messages at once, issuing one bulk send per
+        target platform instead of one call per message per platform.
+
+        Args:
+            messages (list[Message]): The messages to broadcast.
+        """
+        buckets: dict["Platform", list[tuple[int, "Channel", str, "User"]]] = {}
+        for index, message in enumerate(messages):
+            originalPlatformName = message.originalMessage.platform.name
+            for name, platform in self.platforms.items():
+                if name == originalPlatformName:
+                    continue
+                buckets.setdefault(platform, []).append(
+                    (index, message.channel, message.content, message.user)
+                )
+        for platform, batch in buckets.items():
+            returnedIds = await platform.send_messages(
+                [(channel, content, user) for _, channel, content, user in batch]
+            )
+            for (index, _, _, _), returnedId in zip(batch, returnedIds):
+                messages[index].set_id(platform.name, returnedId)
+
+    def defer_broadcast(self, message: "Message") -> None:
+        """
+        Queues a message for a later flush_pending instead of broadcasting it
+        immediately. Messages sharing the same (channel, content, user) are
+        deduplicated into a single provider call per platform.
+
+        Args:
+            message (Message): The message to queue.
+        """
+        key = (id(message.channel), message.content, id(message.user))
+        self._pending.setdefault(key, []).append(message)
+
+    async def flush_pending(self) -> None:
+        """
+        Flushes all deferred broadcasts, issuing one bulk send per target
+        platform and sharing each returned ID across the deduplicated
+        messages in a bucket.
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        buckets = list(pending.values())
+        batches: dict["Platform", list[tuple[int, "Channel", str, "User"]]] = {}
+        for index, bucket in enumerate(buckets):
+            first = bucket[0]
+            origins = {m.originalMessage.platform.name for m in bucket}
+            for name, platform in self.platforms.items():
+                if origins == {name}:
+                    continue
+                batches.setdefault(platform, []).append(
+                    (index, first.channel, first.content, first.user)
+                )
+        for platform, batch in batches.items():
+            returnedIds = await platform.send_messages(
+                [(channel, content, user) for _, channel, content, user in batch]
+            )
+            name = platform.name
+            for (index, _, _, _), returnedId in zip(batch, returnedIds):
+                for message in buckets[index]:
+                    if message.originalMessage.platform.name != name:
+                        message.set_id(name, returnedId)
+
+    def make_reply_str(self, reply: Optional["ReplyFrame"]) -> str:
         """
         Generates a reply string for a given message.
 
         Args:
-            reply (Optional[OriginalMessage]): The original message being replied to.
+            reply (Optional[ReplyFrame]): The pre-resolved reply fields, if any.
 
         Returns:
             str: The formatted reply string.
         """
         if reply:
-            content = reply.content
-            if len(reply.content) > 100:
-                content = reply.content[:70] + "..." + reply.content[-20:]
-            return f"Replying to {reply.user.get_name()}: '{content}'\n"
+            return f"Replying to {reply.user_name}: '{reply.short_content}'\n"
         return ""
 
     def __repr__(self) -> str:
@@ -156,27 +401,65 @@ class CrossChat:
         Returns:
             str: String representation of the CrossChat instance.
         """
-        return (
-            f"CrossChat(channels={self.channels}, users={self.users}, "
-            f"messages={self.messages}, platforms={self.platforms})"
+        return _CROSSCHAT_REPR % (
+            len(self.channels),
+            len(self.users),
+            len(self.messages),
+            list(self.platforms),
         )
 
     def wait_for_platforms(self) -> None:
         """
         Waits for all platforms to pass their health checks.
-        """
-        for platform in self.platforms.values():
-            while not platform.health_check():
+
+        Polls every platform each round with exponential backoff (10 ms up
+        to 1 s), resetting the backoff whenever a platform comes up, so the
+        total wait tracks the slowest platform instead of the sum of all.
+        """
+        pending = list(self.platforms.values())
+        delay = 0.01
+        while pending:
+            still_unhealthy = [
+                platform for platform in pending if not platform.health_check()
+            ]
+            if len(still_unhealthy) < len(pending):
+                delay = 0.01
+            if still_unhealthy:
                 self.logger.info(
-                    f"Waiting for platform {platform.name} to be healthy..."
+                    "Waiting for %d platform(s) to be healthy...",
+                    len(still_unhealthy),
                 )
-                time.sleep(1)
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
+            pending = still_unhealthy
+        self.logger.info("All platforms are healthy!")
+
+    async def _await_healthy(self, platform: "Platform") -> None:
+        """
+        Waits for a single platform's health check with exponential backoff.
+
+        Args:
+            platform (Platform): The platform to wait for.
+        """
+        delay = 0.01
+        while not platform.health_check():
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+    async def await_for_platforms(self) -> None:
+        """
+        Async form of wait_for_platforms: waits for every platform
+        concurrently on the event loop instead of blocking a thread.
+        """
+        await asyncio.gather(
+            *(self._await_healthy(platform) for platform in self._platforms_tuple)
+        )
         self.logger.info("All platforms are healthy!")
 
     async def runner(self) -> None:
         for platform in self.platforms.values():
-            self.logger.info(f"Starting platform {platform.name}...")
-            asyncio.create_task(platform.run())
+            self.logger.info("Starting platform %s...", platform.name)
+            self.tasks.append(asyncio.create_task(platform.run()))
         self.logger.info("All platforms have been started.")
 
     def run(self) -> None:
@@ -185,6 +468,7 @@ class CrossChat:
         """
         self.logger.info("Starting CrossChat and all platforms...")
         self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.runner(), self.loop)
         self.logger.info("Running CrossChat and all platforms...")
 
     async def exit(self) -> None:
@@ -196,17 +480,26 @@ class CrossChat:
         self.logger.info("Exiting CrossChat and closing all platforms...")
         for task in self.tasks:
             task.cancel()
+        if self._shared_connector is not None and not self._shared_connector.closed:
+            await self._shared_connector.close()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if threading.current_thread() is not self.thread:
+            self.thread.join(timeout=1)
 
     def run_coroutine(self, coroutine) -> Any:
         """
-        Runs a coroutine in the event loop.
+        Runs a coroutine on the event loop and blocks until it finishes.
+
+        The wait is event-driven: the future's completion callback wakes
+        the caller immediately, with no polling loop in between.
 
         Args:
             coroutine (asyncio.coroutine): The coroutine to run.
+
+        Returns:
+            Any: The result of the coroutine.
         """
-        future = self.loop.create_task(coroutine)
-        asyncio.wait(future)
-        return future.result()
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
 
     def coroutine_to_future(self, coroutine: Coroutine) -> asyncio.Future:
         """
@@ -230,7 +523,19 @@ class Platform:
         crosschat (CrossChat): The CrossChat instance managing the platform.
     """
 
-    @override
+    __slots__ = (
+        "name",
+        "crosschat",
+        "idx",
+        "_next_id",
+        "_alloc_id",
+        "_broadcast_targets",
+        "_hc_value",
+        "_hc_expiry",
+    )
+
+    health_check_ttl: float = 5.0
+
     def __init__(self, crosschat: CrossChat, name: str = "name"):
         """
         Initializes the Platform instance.
@@ -239,8 +544,14 @@ class Platform:
             crosschat (CrossChat): The CrossChat instance managing the platform.
             name (str): The name of the platform.
         """
-        self.name: str = name
+        self.name: str = sys.intern(name)
         self.crosschat = crosschat
+        self.idx: int = -1
+        self._next_id = itertools.count(time.time_ns() & 0xFFFFF | 100000)
+        self._alloc_id = self._next_id.__next__
+        self._broadcast_targets: tuple["Platform", ...] = ()
+        self._hc_value: bool = False
+        self._hc_expiry: float = 0.0
 
     def add_to_crosschat(self) -> None:
         """
@@ -248,7 +559,6 @@ class Platform:
         """
         self.crosschat.add_platform(self.name, self)
 
-    @override
     async def edit_message(
         self, channel: "Channel", message: "Message", newContent: str
     ) -> None:
@@ -260,13 +570,15 @@ class Platform:
             message (Message): The message to edit.
             newContent (str): The new content for the message.
         """
-        messageId = message.get_id(self.name)
-        channelId = channel.get_id(self.name)
-        self.crosschat.logger.info(
-            f"Editing message {messageId} in channel {channelId} on platform {self.name} to {newContent}"
+        name = self.name
+        self.crosschat.logger.debug(
+            "Editing message %s in channel %s on platform %s to %s",
+            message.ids.get(name),
+            channel.ids.get(name),
+            name,
+            newContent,
         )
 
-    @override
     async def delete_message(self, channel: "Channel", message: "Message") -> None:
         """
         Deletes a message from the platform.
@@ -275,20 +587,21 @@ class Platform:
             channel (Channel): The channel where the message is located.
             message (Message): The message to delete.
         """
-        messageId = message.get_id(self.name)
-        channelId = channel.get_id(self.name)
-        self.crosschat.logger.info(
-            f"Deleting message {messageId} in channel {channelId} on platform {self.name}"
+        name = self.name
+        self.crosschat.logger.debug(
+            "Deleting message %s in channel %s on platform %s",
+            message.ids.get(name),
+            channel.ids.get(name),
+            name,
         )
 
-    @override
     async def send_message(
         self,
         channel: "Channel",
         content: str,
         user: "User",
-        reply: Optional["OriginalMessage"] = None,
-        attachments: list["Attachment"] = [],
+        reply: Optional["ReplyFrame"] = None,
+        attachments: Optional[list["Attachment"]] = None,
     ) -> int:
         """
         Sends a message on the platform.
@@ -297,27 +610,56 @@ class Platform:
             channel (Channel): The channel where the message will be sent.
             content (str): The content of the message.
             user (User): The user sending the message.
-            reply (Optional[OriginalMessage]): The message being replied to, if any.
+            reply (Optional[ReplyFrame]): Pre-resolved fields of the message
+                being replied to, if any.
 
         Returns:
             int: The ID of the sent message.
         """
-        channelId = channel.get_id(self.name)
-        self.crosschat.logger.info(
-            f"Sending message in channel {channelId} on platform {self.name} "
-            f"with content '{content}' by {user.name}"
+        name = self.name
+        self.crosschat.logger.debug(
+            "Sending message in channel %s on platform %s with content '%s' by %s",
+            channel.ids.get(name),
+            name,
+            content,
+            user.name,
         )
         if reply:
-            replyId = reply.get_id(self.name)
-            self.crosschat.logger.info(
-                f"Replying to message {replyId} on platform {reply.platform.name} from {reply.user.get_name()} with content '{reply.content}'"
+            self.crosschat.logger.debug(
+                "Replying to message %s on platform %s from %s with content '%s'",
+                reply.ids.get(name),
+                reply.platform_name,
+                reply.user_name,
+                reply.short_content,
             )
         if attachments:
             for attachment in attachments:
-                self.crosschat.logger.info(f"Sending attachment: {attachment.file_url}")
-        return random.randint(100000, 999999)  # Simulated message ID
+                self.crosschat.logger.debug(
+                    "Sending attachment: %s", attachment.file_url
+                )
+        return self._alloc_id()  # Simulated message ID
+
+    async def send_messages(
+        self, batch: list[tuple["Channel", str, "User"]]
+    ) -> list[int]:
+        """
+        Sends a batch of messages on the platform in one call.
+
+        The default implementation loops over send_message; subclasses can
+        override this to hit a provider bulk API instead.
+
+        Args:
+            batch (list[tuple[Channel, str, User]]): The (channel, content, user)
+                tuples to send.
+
+        Returns:
+            list[int]: The IDs of the sent messages, in batch order.
+        """
+        return [
+            await self.send_message(channel, content, user)
+            for channel, content, user in batch
+        ]
 
-    @override
     async def get_message(self, channel: "Channel", message: "Message") -> None:
         """
         Retrieves a message from the platform.
@@ -326,10 +668,12 @@ class Platform:
             channel (Channel): The channel where the message is located.
             message (Message): The message to retrieve.
         """
-        messageId = message.get_id(self.name)
-        channelId = channel.get_id(self.name)
-        self.crosschat.logger.info(
-            f"Getting message {messageId} in channel {channelId} on platform {self.name}"
+        name = self.name
+        self.crosschat.logger.debug(
+            "Getting message %s in channel %s on platform %s",
+            message.ids.get(name),
+            channel.ids.get(name),
+            name,
         )
 
     def __repr__(self) -> str:
@@ -339,35 +683,47 @@ class Platform:
         Returns:
             str: String representation of the Platform instance.
         """
-        return f"Platform(name={self.name})"
+        return _PLATFORM_REPR % (self.name,)
 
-    @override
     async def run(self) -> None:
         """
         Starts the platform.
         """
-        self.crosschat.logger.info(f"Running platform {self.name}...")
+        self.crosschat.logger.info("Running platform %s...", self.name)
         while True:
             pass
 
-    @override
     async def exit(self) -> None:
         """
         Exits the platform and performs cleanup.
         """
-        self.crosschat.logger.info(f"Exiting platform {self.name}...")
+        self.crosschat.logger.info("Exiting platform %s...", self.name)
         pass
 
-    @override
     def health_check(self) -> bool:
         """
-        Performs a health check for the platform.
+        Performs a health check for the platform, memoizing the result for
+        health_check_ttl seconds so frequent status probes don't re-run it.
+
+        Returns:
+            bool: True if the platform is healthy, otherwise False.
+        """
+        now = time.monotonic()
+        if now < self._hc_expiry:
+            return self._hc_value
+        self._hc_value = self._do_check()
+        self._hc_expiry = now + self.health_check_ttl
+        return self._hc_value
+
+    def _do_check(self) -> bool:
+        """
+        Runs the actual health check; subclasses override this.
 
         Returns:
             bool: True if the platform is healthy, otherwise False.
         """
         self.crosschat.logger.info(
-            f"Performing health check for platform {self.name}..."
+            "Performing health check for platform %s...", self.name
         )
         return True
 
@@ -381,8 +737,12 @@ class Channel:
         ids (dict[str, int]): A dictionary mapping platform names to their respective channel IDs.
         crosschat (CrossChat): The CrossChat instance managing the channel.
         extra_data (dict[str, str]): Additional metadata for the channel.
+        messages (dict[str, dict[int, Message]]): Messages in the channel,
+            indexed by platform name then platform message ID.
     """
 
+    __slots__ = ("name", "ids", "crosschat", "extra_data", "messages")
+
     def __init__(self, crosschat: CrossChat, name: str):
         """
         Initializes the Channel instance.
@@ -395,6 +755,7 @@ class Channel:
         self.ids: dict[str, int] = {}
         self.crosschat = crosschat
         self.extra_data: dict[str, str] = {}
+        self.messages: dict[str, dict[int, "Message"]] = {}
 
     def get_id(self, platform: Union[str, "Platform"]) -> Optional[int]:
         """
@@ -409,6 +770,19 @@ class Channel:
         key = platform if isinstance(platform, str) else platform.name
         return self.ids.get(key)
 
+    def get_id_by_name(self, name: str) -> Optional[int]:
+        """
+        Retrieves the channel ID for a platform name, skipping the isinstance
+        dispatch in get_id for callers that already hold the name string.
+
+        Args:
+            name (str): The platform name.
+
+        Returns:
+            Optional[int]: The channel ID if found, otherwise None.
+        """
+        return self.ids.get(name)
+
     def set_id(self, platform: Union[str, "Platform"], id: int) -> None:
         """
         Sets the channel ID for a specific platform.
@@ -417,8 +791,35 @@ class Channel:
             platform (Union[str, Platform]): The platform name or object.
             id (int): The channel ID to set.
         """
-        key = platform if isinstance(platform, str) else platform.name
+        key = sys.intern(platform) if isinstance(platform, str) else platform.name
+        index = self.crosschat._channel_index.setdefault(key, {})
+        old_id = self.ids.get(key)
+        if old_id is not None:
+            index.pop(old_id, None)
         self.ids[key] = id
+        index[id] = self
+        self.crosschat.channels_version += 1
+
+    def set_ids(self, mapping) -> None:
+        """
+        Sets channel IDs for several platforms in one call.
+
+        Args:
+            mapping: A dict of platform name to channel ID, or an iterable
+                of (name, id) pairs.
+        """
+        items = mapping.items() if isinstance(mapping, dict) else mapping
+        channel_index = self.crosschat._channel_index
+        ids = self.ids
+        for name, id in items:
+            key = sys.intern(name)
+            index = channel_index.setdefault(key, {})
+            old_id = ids.get(key)
+            if old_id is not None:
+                index.pop(old_id, None)
+            ids[key] = id
+            index[id] = self
+        self.crosschat.channels_version += 1
 
     def set_extra_data(self, key: str, value: Any) -> None:
         """
@@ -440,7 +841,7 @@ class Channel:
         Returns:
             Optional[Any]: The metadata value if found, otherwise None.
         """
-        return self.extra_data.get(key, None)
+        return self.extra_data.get(key)
 
     def __repr__(self) -> str:
         """
@@ -449,7 +850,7 @@ class Channel:
         Returns:
             str: String representation of the Channel instance.
         """
-        return f"Channel(name={self.name}, ids={self.ids})"
+        return _CHANNEL_REPR % (self.name, self.ids)
 
     def get_message(
         self, platform: Union[str, "Platform"], id: int
@@ -465,7 +866,7 @@ class Channel:
             Optional[Message]: The message object if found, otherwise None.
         """
         platform_obj = (
-            self.crosschat.get_platform(platform)
+            self.crosschat._get_platform_cached(platform)
             if isinstance(platform, str)
             else platform
         )
@@ -483,9 +884,19 @@ class User:
         username (str): The username of the user.
         name (str): The full name of the user in the format "display_name(@username)".
         profile_picture (str): The URL of the user's profile picture.
+        ids (dict[str, int]): A dictionary mapping platform names to their respective user IDs.
+        crosschat (Optional[CrossChat]): The CrossChat instance managing the user, if any.
     """
 
-    def __init__(self, display_name: str, username: str, profile_picture: str = None):
+    __slots__ = ("display_name", "username", "name", "profile_picture", "_profile_picture", "ids", "crosschat")
+
+    def __init__(
+        self,
+        display_name: str,
+        username: str,
+        profile_picture: str = None,
+        crosschat: Optional[CrossChat] = None,
+    ):
         """
         Initializes the User instance.
 
@@ -493,11 +904,60 @@ class User:
             display_name (str): The display name of the user.
             username (str): The username of the user.
             profile_picture (str, optional): The URL of the user's profile picture. Defaults to None.
+            crosschat (Optional[CrossChat], optional): The CrossChat instance managing the user. Defaults to None.
         """
         self.display_name = display_name
         self.username = username
         self.name = f"{display_name}(@{username})"
         self.profile_picture = profile_picture
+        self._profile_picture = (
+            profile_picture
+            or "https://i.pinimg.com/474x/25/1c/e1/251ce139d8c07cbcc9daeca832851719.jpg"
+        )
+        self.ids: dict[str, int] = {}
+        self.crosschat = crosschat
+
+    def get_id(self, platform: Union[str, "Platform"]) -> Optional[int]:
+        """
+        Retrieves the user ID for a specific platform.
+
+        Args:
+            platform (Union[str, Platform]): The platform name or object.
+
+        Returns:
+            Optional[int]: The user ID if found, otherwise None.
+        """
+        key = platform if isinstance(platform, str) else platform.name
+        return self.ids.get(key)
+
+    def get_id_by_name(self, name: str) -> Optional[int]:
+        """
+        Retrieves the user ID for a platform name, skipping the isinstance
+        dispatch in get_id for callers that already hold the name string.
+
+        Args:
+            name (str): The platform name.
+
+        Returns:
+            Optional[int]: The user ID if found, otherwise None.
+        """
+        return self.ids.get(name)
+
+    def set_id(self, platform: Union[str, "Platform"], id: int) -> None:
+        """
+        Sets the user ID for a specific platform.
+
+        Args:
+            platform (Union[str, Platform]): The platform name or object.
+            id (int): The user ID to set.
+        """
+        key = sys.intern(platform) if isinstance(platform, str) else platform.name
+        if self.crosschat is not None:
+            old_id = self.ids.get(key)
+            if old_id is not None:
+                self.crosschat._user_index.pop((key, old_id), None)
+            self.crosschat._user_index[(key, id)] = self
+        self.ids[key] = id
 
     def get_profile_picture(self) -> str:
         """
@@ -506,11 +966,7 @@ class User:
         Returns:
             str: The URL of the user's profile picture, or a default image URL if not set.
         """
-        return (
-            self.profile_picture
-            if self.profile_picture
-            else "https://i.pinimg.com/474x/25/1c/e1/251ce139d8c07cbcc9daeca832851719.jpg"
-        )
+        return self._profile_picture
 
     def get_name(self) -> str:
         """
@@ -519,7 +975,7 @@ class User:
         Returns:
             str: The full name of the user in the format "display_name(@username)".
         """
-        return f"{self.display_name}(@{self.username})"
+        return self.name
 
     def __repr__(self) -> str:
         """
@@ -528,7 +984,27 @@ class User:
         Returns:
             str: String representation of the User instance.
         """
-        return f"User(display_name={self.display_name}, username={self.username})"
+        return _USER_REPR % (self.display_name, self.username)
+
+
+@dataclass(slots=True, frozen=True)
+class ReplyFrame:
+    """
+    Pre-resolved fields of a message being replied to, built once per
+    Message so every platform's send_message reads plain attributes
+    instead of walking the OriginalMessage object graph.
+
+    Attributes:
+        ids (dict[str, int]): Platform name to message ID for the replied-to message.
+        platform_name (str): The platform the replied-to message originated on.
+        user_name (str): The formatted name of the replied-to message's author.
+        short_content (str): The truncated content of the replied-to message.
+    """
+
+    ids: dict[str, int]
+    platform_name: str
+    user_name: str
+    short_content: str
 
 
 class Attachment:
@@ -538,6 +1014,8 @@ class Attachment:
         file_url (str): The URL of the file attachment.
     """
 
+    __slots__ = ("file_url",)
+
     def __init__(self, file_url: str):
         """
         Initializes the Attachment instance.
@@ -554,7 +1032,7 @@ class Attachment:
         Returns:
             str: String representation of the Attachment instance.
         """
-        return f"Attachment(file_url={self.file_url})"
+        return _ATTACHMENT_REPR % (self.file_url,)
 
 
 class OriginalMessage:
@@ -570,6 +1048,17 @@ class OriginalMessage:
         crosschat (CrossChat): The CrossChat instance managing the message.
     """
 
+    __slots__ = (
+        "content",
+        "id",
+        "platform",
+        "user",
+        "channel",
+        "crosschat",
+        "attachments",
+        "_short_content",
+    )
+
     def __init__(
         self,
         crosschat: CrossChat,
@@ -578,7 +1067,7 @@ class OriginalMessage:
         content: str,
         id: int,
         platform: Platform,
-        attachments: list[Attachment] = [],
+        attachments: Optional[list[Attachment]] = None,
     ):
         """
         Initializes the OriginalMessage instance.
@@ -597,7 +1086,25 @@ class OriginalMessage:
         self.user = user
         self.channel = channel
         self.crosschat = crosschat
-        self.attachments = attachments
+        self.attachments = attachments if attachments is not None else ()
+        self._short_content: Optional[str] = None
+
+    @property
+    def short_content(self) -> str:
+        """
+        The message content truncated for reply previews, computed once on
+        first access and cached.
+
+        Returns:
+            str: The content, shortened to 70 + 20 chars around an ellipsis
+            when longer than 100 chars.
+        """
+        if self._short_content is None:
+            content = self.content
+            if len(content) > 100:
+                content = f"{content[:70]}...{content[-20:]}"
+            self._short_content = content
+        return self._short_content
 
     def __repr__(self) -> str:
         """
@@ -606,10 +1113,12 @@ class OriginalMessage:
         Returns:
             str: String representation of the OriginalMessage instance.
         """
-        return (
-            f"OriginalMessage(content={self.content}, id={self.id}, "
-            f"platform={self.platform.name}, user={self.user.name}, "
-            f"channel={self.channel.name})"
+        return _ORIGINALMESSAGE_REPR % (
+            self.content,
+            self.id,
+            self.platform.name,
+            self.user.name,
+            self.channel.name,
         )
 
 
@@ -628,6 +1137,18 @@ class Message:
         reply (Optional[OriginalMessage]): The message being replied to, if any.
     """
 
+    __slots__ = (
+        "channel",
+        "user",
+        "content",
+        "ids",
+        "originalMessage",
+        "crosschat",
+        "reply",
+        "_reply_str",
+        "_reply_frame",
+    )
+
     def __init__(
         self,
         crosschat: CrossChat,
@@ -648,8 +1169,10 @@ class Message:
         self.ids: dict[str, int] = {}
         self.originalMessage = originalMessage
         self.crosschat = crosschat
-        self.ids[originalMessage.platform.name] = originalMessage.id
+        self.set_id(originalMessage.platform.name, originalMessage.id)
         self.reply = reply
+        self._reply_str: Optional[str] = None
+        self._reply_frame: Optional[ReplyFrame] = None
 
     def get_id(self, platform: Union[str, Platform]) -> Optional[int]:
         """
@@ -664,6 +1187,19 @@ class Message:
         key = platform if isinstance(platform, str) else platform.name
         return self.ids.get(key)
 
+    def get_id_by_name(self, name: str) -> Optional[int]:
+        """
+        Retrieves the message ID for a platform name, skipping the isinstance
+        dispatch in get_id for callers that already hold the name string.
+
+        Args:
+            name (str): The platform name.
+
+        Returns:
+            Optional[int]: The message ID if found, otherwise None.
+        """
+        return self.ids.get(name)
+
     def set_id(self, platform: Union[str, Platform], id: int) -> None:
         """
         Sets the message ID for a specific platform.
@@ -672,26 +1208,103 @@ class Message:
             platform (Union[str, Platform]): The platform name or object.
             id (int): The message ID to set.
         """
-        key = platform if isinstance(platform, str) else platform.name
+        key = sys.intern(platform) if isinstance(platform, str) else platform.name
+        channel_messages = self.channel.messages.setdefault(key, {})
+        old_id = self.ids.get(key)
+        if old_id is not None:
+            self.crosschat._message_index.pop((key, old_id), None)
+            channel_messages.pop(old_id, None)
         self.ids[key] = id
+        self.crosschat._message_index[(key, id)] = self
+        channel_messages[id] = self
+
+    def set_ids(self, mapping) -> None:
+        """
+        Sets message IDs for several platforms in one call.
+
+        Args:
+            mapping: A dict of platform name to message ID, or an iterable
+                of (name, id) pairs.
+        """
+        items = mapping.items() if isinstance(mapping, dict) else mapping
+        message_index = self.crosschat._message_index
+        channel_messages = self.channel.messages
+        ids = self.ids
+        for name, id in items:
+            key = sys.intern(name)
+            messages = channel_messages.setdefault(key, {})
+            old_id = ids.get(key)
+            if old_id is not None:
+                message_index.pop((key, old_id), None)
+                messages.pop(old_id, None)
+            ids[key] = id
+            message_index[(key, id)] = self
+            messages[id] = self
+
+    def reply_frame(self) -> Optional["ReplyFrame"]:
+        """
+        Returns the pre-resolved reply fields for this message, built once
+        on first call so platforms read plain attributes instead of
+        walking the replied-to OriginalMessage per send.
+
+        Returns:
+            Optional[ReplyFrame]: The reply frame, or None if this message
+            is not a reply.
+        """
+        reply = self.reply
+        if reply is None:
+            return None
+        if self._reply_frame is None:
+            wrapped = self.crosschat.get_message(reply.id, reply.platform.name)
+            ids = wrapped.ids if wrapped is not None else {reply.platform.name: reply.id}
+            self._reply_frame = ReplyFrame(
+                ids, reply.platform.name, reply.user.name, reply.short_content
+            )
+        return self._reply_frame
+
+    def reply_str(self) -> str:
+        """
+        Returns the formatted reply prefix for this message, computing it
+        once and reusing the cached string on later calls.
+
+        Returns:
+            str: The formatted reply string, or "" if this is not a reply.
+        """
+        if self._reply_str is None:
+            self._reply_str = self.crosschat.make_reply_str(self.reply_frame())
+        return self._reply_str
 
     async def broadcast(self) -> None:
         """
-        Broadcasts the message to all platforms except the one it originated from.
+        Broadcasts the message to all platforms except the one it originated from,
+        sending to every platform concurrently.
         """
-        originalPlatformName = self.originalMessage.platform.name
-        platforms = self.crosschat.get_platforms_str()
+        channel = self.channel
+        content = self.content
+        user = self.user
+        reply = self.reply_frame()
+        semaphore = asyncio.Semaphore(self.crosschat.maxConcurrentWorkers)
 
-        if originalPlatformName in platforms:
-            platforms.remove(originalPlatformName)
+        async def send(platform: "Platform") -> tuple[str, int]:
+            async with semaphore:
+                return platform.name, await platform.send_message(
+                    channel, content, user, reply
+                )
 
-        for platformName in platforms:
-            platform = self.crosschat.get_platform(platformName)
-            if platform is not None:
-                returnedId = await platform.send_message(
-                    self.channel, self.content, self.user, self.reply
+        targets = self.originalMessage.platform._broadcast_targets
+        results = await asyncio.gather(
+            *(send(platform) for platform in targets), return_exceptions=True
+        )
+        for platform, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                self.crosschat.logger.error(
+                    "Failed to broadcast message to platform %s: %s",
+                    platform.name,
+                    result,
                 )
-                self.set_id(platform.name, returnedId)
+            else:
+                platformName, returnedId = result
+                self.set_id(platformName, returnedId)
 
     async def edit(self, newContent: str) -> None:
         """
@@ -700,18 +1313,20 @@ class Message:
         Args:
             newContent (str): The new content for the message.
         """
-        platforms = self.crosschat.platforms.values()
-        for platform in platforms:
-            await platform.edit_message(self.channel, self, newContent)
+        editMessage = operator.methodcaller("edit_message", self.channel, self, newContent)
+        await asyncio.gather(
+            *(editMessage(platform) for platform in self.crosschat._platforms_tuple)
+        )
         self.content = newContent
 
     async def delete(self) -> None:
         """
         Deletes the message from all platforms.
         """
-        platforms = self.crosschat.platforms.values()
-        for platform in platforms:
-            await platform.delete_message(self.channel, self)
+        deleteMessage = operator.methodcaller("delete_message", self.channel, self)
+        await asyncio.gather(
+            *(deleteMessage(platform) for platform in self.crosschat._platforms_tuple)
+        )
 
     def __repr__(self) -> str:
         """
@@ -720,10 +1335,12 @@ class Message:
         Returns:
             str: String representation of the Message instance.
         """
-        return (
-            f"Message(channel={self.channel}, user={self.user}, "
-            f"content={self.content}, ids={self.ids}), "
-            f"OriginalMessage={self.originalMessage}"
+        return _MESSAGE_REPR % (
+            self.channel,
+            self.user,
+            _repr.repr(self.content),
+            self.ids,
+            self.originalMessage.id,
         )
 
 
@@ -761,10 +1378,9 @@ def main():
     cc.run()
     cc.wait_for_platforms()
     discord_channel = Channel(cc, "general")
-    discord_channel.set_id("discord", 100)
-    discord_channel.set_id("slack", 200)
-    discord_channel.set_id("telegram", 300)
-    discord_channel.set_id("google_chat", 400)
+    discord_channel.set_ids(
+        {"discord": 100, "slack": 200, "telegram": 300, "google_chat": 400}
+    )
     cc.add_channel(discord_channel)
     user = User("Alice", "alice123")
     cc.add_user(user)
@@ -1,7 +1,9 @@
 import crosschat
 import discord
+import aiohttp
+import asyncio
+import time
 from typing import Optional
-from rich import print
 
 
 class DiscordPlatform(crosschat.Platform):
@@ -29,14 +31,38 @@ class DiscordPlatform(crosschat.Platform):
             name (str, optional): The name of the platform. Defaults to "discord".
         """
         super().__init__(crosschat=crosschat, name=name)
-        self.name = name
-        self.client = discord.Client(intents=discord.Intents.all())
+        self._connector = crosschat.shared_connector()
+        # Only the events a message bridge needs; skip presences, typing,
+        # and member chunks entirely.
+        intents = discord.Intents.none()
+        intents.guilds = True
+        intents.guild_messages = True
+        intents.message_content = True
+        intents.webhooks = True
+        self.client = discord.AutoShardedClient(
+            intents=intents,
+            connector=self._connector,
+            chunk_guilds_at_startup=False,
+            member_cache_flags=discord.MemberCacheFlags.none(),
+        )
         self.client.event(self.on_ready)
         self.client.event(self.on_message)
+        self.client.event(self.on_guild_channel_delete)
         self.token = token
         self.running = False
         self.add_to_crosschat()
         self.task = None
+        self._session = aiohttp.ClientSession(
+            connector=self._connector, connector_owner=False, loop=crosschat.loop
+        )
+        self._queues: dict[int, asyncio.Queue] = {}
+        self._workers: dict[int, asyncio.Task] = {}
+        self._send_sem = asyncio.Semaphore(5)
+        self._upload_sem = asyncio.Semaphore(5)
+        self._chan_cache: dict[int, tuple[float, discord.abc.Messageable]] = {}
+        self._webhook_cache: dict[int, discord.Webhook] = {}
+        self._bridged_channel_ids: frozenset[int] = frozenset()
+        self._bridged_version = -1
 
     async def on_ready(self):
         """
@@ -44,7 +70,7 @@ class DiscordPlatform(crosschat.Platform):
 
         Prints the bot's username and sets the running status to True.
         """
-        self.crosschat.logger.info(f"Logged in as {self.client.user}")
+        self.crosschat.logger.info("Logged in as %s", self.client.user)
         self.running = True
 
     async def on_message(self, message: discord.Message):
@@ -54,18 +80,30 @@ class DiscordPlatform(crosschat.Platform):
         Args:
             message (discord.Message): The message object received from Discord.
         """
-        # print(f"Received message: {message.content}")
         # Ignore messages from the bot itself
         if message.author == self.client.user:
             return
 
+        # Reject messages in non-bridged channels with one set lookup
+        if self._bridged_version != self.crosschat.channels_version:
+            self._bridged_channel_ids = frozenset(
+                self.crosschat._channel_index.get(self.name, ())
+            )
+            self._bridged_version = self.crosschat.channels_version
+        if message.channel.id not in self._bridged_channel_ids:
+            return
+
         # Get the corresponding channel in CrossChat
         channel = self.crosschat.get_channel(message.channel.id, self.name)
         # print(f"Channel: {channel}")
         if channel:
             # Get the corresponding user in CrossChat
             user = crosschat.User(message.author.display_name, message.author.name)
-            attachments = [crosschat.Attachment(i.url) for i in message.attachments]
+            attachments = (
+                [crosschat.Attachment(i.url) for i in message.attachments]
+                if message.attachments
+                else None
+            )
             # Create an original message and wrap it in a Message object
             original_msg = crosschat.OriginalMessage(
                 self.crosschat,
@@ -79,28 +117,121 @@ class DiscordPlatform(crosschat.Platform):
             wrapped_msg = crosschat.Message(self.crosschat, original_msg)
             # Broadcast the message
             await wrapped_msg.broadcast()
-            print(wrapped_msg)
+            self.crosschat.logger.debug("Broadcast %r", wrapped_msg)
+
+    channel_cache_ttl: float = 60.0
 
-    def make_webhook(self, id: int, token: str) -> None:
+    def _resolve_channel(
+        self, channel: crosschat.Channel
+    ) -> Optional[discord.abc.Messageable]:
+        """
+        Resolves the Discord channel object for a CrossChat channel,
+        caching the result for channel_cache_ttl seconds so hot channels
+        skip discord.py's guild-cache walk.
+
+        Args:
+            channel (crosschat.Channel): The CrossChat channel to resolve.
+
+        Returns:
+            Optional[discord.abc.Messageable]: The Discord channel, or None if not found.
         """
-        Creates a partial webhook object.
+        channel_id = channel.get_id_by_name(self.name)
+        now = time.monotonic()
+        cached = self._chan_cache.get(channel_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        discord_channel = self.client.get_channel(channel_id)
+        if discord_channel is not None:
+            self._chan_cache[channel_id] = (
+                now + self.channel_cache_ttl,
+                discord_channel,
+            )
+        return discord_channel
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """
+        Event handler triggered when a guild channel is deleted.
+
+        Args:
+            channel (discord.abc.GuildChannel): The deleted channel.
+        """
+        self._chan_cache.pop(channel.id, None)
+
+    async def _with_backoff(self, factory, attempts: int = 5):
+        """
+        Runs a webhook call, retrying on rate limits and server errors.
+
+        429 responses sleep for the Retry-After the API asks for; 5xx
+        responses back off exponentially. Anything else (or exhausting the
+        attempts) propagates.
+
+        Args:
+            factory: A zero-argument callable returning the coroutine to await.
+            attempts (int, optional): Maximum tries. Defaults to 5.
+
+        Returns:
+            The result of the underlying call.
+        """
+        for attempt in range(attempts):
+            try:
+                return await factory()
+            except discord.HTTPException as exc:
+                if attempt == attempts - 1:
+                    raise
+                if exc.status == 429:
+                    delay = float(exc.response.headers.get("Retry-After", 1))
+                elif 500 <= exc.status < 600:
+                    delay = 2**attempt
+                else:
+                    raise
+                self.crosschat.logger.warning(
+                    "Discord returned %s; retrying in %.1fs (attempt %d/%d)",
+                    exc.status,
+                    delay,
+                    attempt + 1,
+                    attempts,
+                )
+                await asyncio.sleep(delay)
+
+    def _channel_webhook(self, channel: crosschat.Channel) -> Optional[discord.Webhook]:
+        """
+        Returns the webhook for a channel, reading extra_data only on the
+        first lookup and a plain dict afterwards.
+
+        Args:
+            channel (crosschat.Channel): The CrossChat channel.
+
+        Returns:
+            Optional[discord.Webhook]: The channel's webhook, or None if not configured.
+        """
+        channel_id = channel.get_id_by_name(self.name)
+        webhook = self._webhook_cache.get(channel_id)
+        if webhook is None:
+            webhook = channel.get_extra_data("discord_webhook")
+            if webhook is not None:
+                self._webhook_cache[channel_id] = webhook
+        return webhook
+
+    def make_webhook(self, id: int, token: str) -> discord.Webhook:
+        """
+        Creates a partial async webhook object bound to the platform's session.
 
         Args:
             id (int): The webhook ID.
             token (str): The webhook token.
 
         Returns:
-            discord.SyncWebhook: The created webhook object.
+            discord.Webhook: The created webhook object.
         """
-        return discord.SyncWebhook.partial(id=id, token=token)
+        return discord.Webhook.partial(id=id, token=token, session=self._session)
 
     async def send_message(
         self,
         channel: crosschat.Channel,
         content: str,
         user: crosschat.User = crosschat.User,
-        reply: Optional[crosschat.OriginalMessage] = None,
-        attachments: list[crosschat.Attachment] = [],
+        reply: Optional[crosschat.ReplyFrame] = None,
+        attachments: Optional[list[crosschat.Attachment]] = None,
     ) -> int:
         """
         Sends a message to a Discord channel.
@@ -109,41 +240,147 @@ class DiscordPlatform(crosschat.Platform):
             channel (crosschat.Channel): The target channel.
             content (str): The message content.
             user (crosschat.User, optional): The user sending the message. Defaults to crosschat.User.
-            reply (Optional[crosschat.OriginalMessage], optional): The message being replied to. Defaults to None.
+            reply (Optional[crosschat.ReplyFrame], optional): Pre-resolved fields of the message being replied to. Defaults to None.
             attachments (list[crosschat.Attachment], optional): Attachments to include. Defaults to an empty list.
 
+        Returns:
+            int: The ID of the sent message, or 0 if the channel is not found.
+        """
+        # Serialize sends per destination channel, fan out across channels
+        channel_id = channel.get_id_by_name(self.name)
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = asyncio.Queue()
+            self._workers[channel_id] = asyncio.create_task(self._send_worker(queue))
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((future, channel, content, user, reply, attachments))
+        return await future
+
+    async def _send_worker(self, queue: asyncio.Queue) -> None:
+        """
+        Drains one channel's send queue in FIFO order.
+
+        Sends to the same channel are serialized here so the webhook never
+        trips Discord's per-channel rate limit, while the semaphore caps
+        how many channels send at once.
+
+        Args:
+            queue (asyncio.Queue): The queue of pending send jobs.
+        """
+        while True:
+            future, channel, content, user, reply, attachments = await queue.get()
+            try:
+                async with self._send_sem:
+                    result = await self._do_send(
+                        channel, content, user, reply, attachments
+                    )
+            except Exception as exc:
+                if not future.cancelled():
+                    future.set_exception(exc)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                queue.task_done()
+
+    async def _do_send(
+        self,
+        channel: crosschat.Channel,
+        content: str,
+        user: crosschat.User,
+        reply: Optional[crosschat.ReplyFrame],
+        attachments: Optional[list[crosschat.Attachment]],
+    ) -> int:
+        """
+        Performs the actual webhook send for one queued message.
+
+        Args:
+            channel (crosschat.Channel): The target channel.
+            content (str): The message content.
+            user (crosschat.User): The user sending the message.
+            reply (Optional[crosschat.ReplyFrame]): Pre-resolved reply fields, if any.
+            attachments (Optional[list[crosschat.Attachment]]): Attachments to include.
+
         Returns:
             int: The ID of the sent message, or 0 if the channel is not found.
         """
         # Send the message to the specified Discord channel
-        discord_channel = self.client.get_channel(channel.get_id(self.name))
+        discord_channel = self._resolve_channel(channel)
         if discord_channel:
-            webhook: discord.Webhook = channel.get_extra_data("discord_webhook")
+            webhook: discord.Webhook = self._channel_webhook(channel)
             if not webhook:
-                self.crosschat.logger.error(f"Webhook not found in channel {channel}.")
+                self.crosschat.logger.error("Webhook not found in channel %s.", channel)
                 return 0
-            message: discord.WebhookMessage = webhook.send(
-                content=self.crosschat.make_reply_str(reply) + content,
-                username=user.get_name(),
-                avatar_url=user.get_profile_picture(),
-                wait=1,
-            )
-            message_id = message.id
-            for attachment in attachments:
-                message.reply(
-                    content=attachment.file_url,
+            message: discord.WebhookMessage = await self._with_backoff(
+                lambda: webhook.send(
+                    content=self.crosschat.make_reply_str(reply) + content,
                     username=user.get_name(),
                     avatar_url=user.get_profile_picture(),
+                    wait=True,
                 )
-                self.crosschat.logger.info(
-                    f"Uploaded attachment: '{attachment.file_url}' in channel {channel} on Discord."
-                )
+            )
+            message_id = message.id
+            if attachments:
+                username = user.get_name()
+                avatar_url = user.get_profile_picture()
+                async with asyncio.TaskGroup() as tg:
+                    for attachment in attachments:
+                        tg.create_task(
+                            self._bounded_upload(
+                                webhook, attachment, username, avatar_url, channel
+                            )
+                        )
             self.crosschat.logger.info(
-                f"Sent message: '{content}' in channel {channel} on Discord. ID: {message_id}"
+                "Sent message: '%s' in channel %s on Discord. ID: %s",
+                content,
+                channel,
+                message_id,
             )
             return message_id  # Returning the message ID
         return 0  # In case the channel is not found
 
+    async def _bounded_upload(
+        self,
+        webhook: discord.Webhook,
+        attachment: crosschat.Attachment,
+        username: str,
+        avatar_url: str,
+        channel: crosschat.Channel,
+    ) -> None:
+        """
+        Uploads one attachment under the upload semaphore, logging the
+        outcome instead of raising so sibling uploads keep going.
+
+        Args:
+            webhook (discord.Webhook): The channel's webhook.
+            attachment (crosschat.Attachment): The attachment to post.
+            username (str): The display name to post under.
+            avatar_url (str): The avatar to post with.
+            channel (crosschat.Channel): The CrossChat channel, for logging.
+        """
+        async with self._upload_sem:
+            try:
+                await self._with_backoff(
+                    lambda: webhook.send(
+                        content=attachment.file_url,
+                        username=username,
+                        avatar_url=avatar_url,
+                    )
+                )
+            except Exception as exc:
+                self.crosschat.logger.error(
+                    "Failed to upload attachment '%s' in channel %s: %s",
+                    attachment.file_url,
+                    channel,
+                    exc,
+                )
+            else:
+                self.crosschat.logger.info(
+                    "Uploaded attachment: '%s' in channel %s on Discord.",
+                    attachment.file_url,
+                    channel,
+                )
+
     async def edit_message(
         self, channel: crosschat.Channel, message: crosschat.Message, new_content: str
     ) -> None:
@@ -156,14 +393,15 @@ class DiscordPlatform(crosschat.Platform):
             new_content (str): The new content for the message.
         """
         # Get the message ID from CrossChat and edit the message on Discord
-        discord_channel = self.client.get_channel(channel.get_id(self.name))
+        discord_channel = self._resolve_channel(channel)
         if discord_channel:
-            webhook: discord.Webhook = channel.get_extra_data("discord_webhook")
-            message: discord.WebhookMessage = webhook.edit_message(
-                message_id=message.get_id(self.name), content=new_content
+            webhook: discord.Webhook = self._channel_webhook(channel)
+            message_id = message.get_id_by_name(self.name)
+            message: discord.WebhookMessage = await self._with_backoff(
+                lambda: webhook.edit_message(message_id=message_id, content=new_content)
             )
             self.crosschat.logger.info(
-                f"Edited message with ID {message.id} to: '{message.content}'"
+                "Edited message with ID %s to: '%s'", message.id, message.content
             )
 
     async def delete_message(
@@ -179,12 +417,13 @@ class DiscordPlatform(crosschat.Platform):
             message (crosschat.Message): The message to delete.
         """
         # Get the message ID from CrossChat and delete the message on Discord
-        discord_channel = self.client.get_channel(channel.get_id(self.name))
+        discord_channel = self._resolve_channel(channel)
         if discord_channel:
-            webhook: discord.Webhook = channel.get_extra_data("discord_webhook")
-            webhook.delete_message(message.get_id(self.name))
+            webhook: discord.Webhook = self._channel_webhook(channel)
+            message_id = message.get_id_by_name(self.name)
+            await self._with_backoff(lambda: webhook.delete_message(message_id))
             self.crosschat.logger.info(
-                f"Deleted message with ID {message.get_id(self.name)}"
+                "Deleted message with ID %s", message.get_id_by_name(self.name)
             )
 
     async def get_message(
@@ -203,10 +442,12 @@ class DiscordPlatform(crosschat.Platform):
             Optional[crosschat.OriginalMessage]: The retrieved message, or None if not found.
         """
         # Get the message ID from CrossChat and retrieve the message from Discord
-        discord_channel = self.client.get_channel(channel.get_id(self.name))
+        discord_channel = self._resolve_channel(channel)
         if discord_channel:
-            discord_message = discord_channel.fetch_message(message.get_id(self.name))
-            print(f"Fetched message with ID {discord_message.id}")
+            discord_message = discord_channel.fetch_message(message.get_id_by_name(self.name))
+            self.crosschat.logger.debug(
+                "Fetched message with ID %s", discord_message.id
+            )
             wrapped_user = crosschat.User(
                 discord_message.author.de, discord_message.author.id
             )
@@ -248,6 +489,11 @@ class DiscordPlatform(crosschat.Platform):
         Stops the Discord client and terminates the thread.
         """
         self.crosschat.logger.info("Stopping Discord client...")
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+        self._queues.clear()
+        await self._session.close()
         await self.client.close()
         self.crosschat.logger.info("Discord client stopped.")
         self.running = False
@@ -38,10 +38,9 @@ telegram.add_to_crosschat()
 google_chat.add_to_crosschat()
 # Step 3: Create and add channels
 discord_channel = crosschat.Channel(cc, "general")
-discord_channel.set_id("discord", 100)
-discord_channel.set_id("slack", 200)
-discord_channel.set_id("telegram", 300)
-discord_channel.set_id("google_chat", 400)
+discord_channel.set_ids(
+    {"discord": 100, "slack": 200, "telegram": 300, "google_chat": 400}
+)
 cc.add_channel(discord_channel)
 # Step 4: Create and add a user
 user = crosschat.User("Alice", "alice123")
@@ -1,13 +1,14 @@
 import crosschat
-from typing import Optional, Sequence, Coroutine
+from typing import Optional
+import asyncio
 import telegram
 import telegram.ext
-import telegram._utils.types
-import telegram._utils.defaultvalue
-import signal
-import threading
-import platform
-from rich import print
+import telegram.request
+
+
+_MESSAGE_TMPL = "%s:\n%s"
+_ALL_UPDATES = telegram.Update.ALL_TYPES
+_NO_PREVIEW = telegram.LinkPreviewOptions(is_disabled=True)
 
 
 class TelegramPlatform(crosschat.Platform):
@@ -18,14 +19,23 @@ class TelegramPlatform(crosschat.Platform):
         name: str = "telegram",
     ):
         super().__init__(crosschat=crosschat, name=name)
-        self.name = name
         self.app: telegram.ext.Application = (
-            telegram.ext.Application.builder().token(token).build()
+            telegram.ext.Application.builder()
+            .token(token)
+            .request(telegram.request.HTTPXRequest(connection_pool_size=64))
+            .get_updates_request(telegram.request.HTTPXRequest(connection_pool_size=8))
+            .concurrent_updates(256)
+            .build()
         )
         self.add_to_crosschat()
         self.logger = crosschat.logger
         self.thread = None
+        self._stop_event = asyncio.Event()
+        self._pending: dict[int, list[tuple[asyncio.Future, str]]] = {}
+        self._flush_tasks: dict[int, asyncio.Task] = {}
+        self._bot_send = None
 
+    @staticmethod
     async def start(
         update: telegram.Update, context: telegram.ext.ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -36,122 +46,118 @@ class TelegramPlatform(crosschat.Platform):
             reply_markup=telegram.ForceReply(selective=True),
         )
 
+    @staticmethod
     async def updateData(
         update: telegram.Update, context: telegram.ext.ContextTypes.DEFAULT_TYPE
     ) -> None:
         await update.message.reply_text(update.effective_chat.id)
 
+    batch_window: float = 0.5
+    batch_max: int = 10
+
     async def send_message(
         self,
         channel: "Channel",
         content: str,
         user: "User",
-        reply: Optional["OriginalMessage"] = None,
-        attachments: list["Attachment"] = [],
+        reply: Optional["ReplyFrame"] = None,
+        attachments: Optional[list["Attachment"]] = None,
     ) -> int:
-        coroutine = self.app.bot.send_message(
-            chat_id=channel.get_id(self.name), text=f"{user.get_name()}:\n{content}"
+        """
+        Queues a message for the channel's chat, coalescing messages that
+        arrive within batch_window (or once batch_max pile up) into one
+        Telegram request to stay under the global send-rate cap.
+
+        Returns:
+            int: The Telegram message ID of the request that carried this message.
+        """
+        chat_id = channel.get_id_by_name(self.name)
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(chat_id, [])
+        pending.append((future, _MESSAGE_TMPL % (user.get_name(), content)))
+        if len(pending) >= self.batch_max:
+            await self._flush_chat(chat_id)
+        elif chat_id not in self._flush_tasks:
+            self._flush_tasks[chat_id] = asyncio.create_task(
+                self._delayed_flush(chat_id)
+            )
+        return await future
+
+    async def _delayed_flush(self, chat_id: int) -> None:
+        """
+        Flushes a chat's pending batch after the coalescing window elapses.
+
+        Args:
+            chat_id (int): The Telegram chat whose batch to flush.
+        """
+        await asyncio.sleep(self.batch_window)
+        self._flush_tasks.pop(chat_id, None)
+        await self._flush_chat(chat_id)
+
+    async def _flush_chat(self, chat_id: int) -> None:
+        """
+        Sends a chat's pending batch as one message and resolves the
+        futures of every coalesced send.
+
+        Args:
+            chat_id (int): The Telegram chat whose batch to flush.
+        """
+        batch = self._pending.pop(chat_id, None)
+        if not batch:
+            return
+        flush_task = self._flush_tasks.pop(chat_id, None)
+        if flush_task is not None and flush_task is not asyncio.current_task():
+            flush_task.cancel()
+        self.logger.debug(
+            "Sending %d coalesced message(s) to %s chat %s",
+            len(batch),
+            self.name,
+            chat_id,
         )
-        print(coroutine)
-        print(f"Sending message to {self.name} channel {channel.get_id(self.name)}")
-        result: telegram.Message = await coroutine
-        print(f"Message sent to {self.name} channel {channel.get_id(self.name)}")
-        return result.message_id
-
-    # def make_runner(self):
-    #     poll_interval: float = 0.0
-    #     timeout: int = 10
-    #     bootstrap_retries: int = 0
-    #     allowed_updates: Optional[Sequence[str]] = telegram.Update.ALL_TYPES
-    #     drop_pending_updates: Optional[bool] = None
-    #     if not self.app.updater:
-    #         raise RuntimeError(
-    #             "Application.run_polling is only available if the application has an Updater."
-    #         )
-    #     print("4")
-
-    #     def error_callback(exc: telegram.error.TelegramError) -> None:
-    #         self.app.create_task(self.app.process_error(error=exc, update=None))
-
-    #     print("0")
-    #     updater_coroutine = self.app.updater.start_polling(
-    #         poll_interval=poll_interval,
-    #         timeout=timeout,
-    #         bootstrap_retries=bootstrap_retries,
-    #         allowed_updates=allowed_updates,
-    #         drop_pending_updates=drop_pending_updates,
-    #         error_callback=error_callback,  # if there is an error in fetching updates
-    #     )
-    #     print("6")
+        try:
+            send = self._bot_send or self.app.bot.send_message
+            result: telegram.Message = await send(
+                chat_id=chat_id,
+                text="\n".join(text for _, text in batch),
+                disable_notification=True,
+                link_preview_options=_NO_PREVIEW,
+            )
+        except Exception as exc:
+            for future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for future, _ in batch:
+                if not future.done():
+                    future.set_result(result.message_id)
 
     async def run(self):
-        print("Running Telegram bot")
+        """
+        Starts the Telegram bot on the shared loop using PTB's async
+        entrypoints, then parks on the stop event until exit() is called.
+        """
+        self.logger.info("Running Telegram bot")
         self.app.add_handler(telegram.ext.CommandHandler("start", self.start))
-        print(1)
         self.app.add_handler(telegram.ext.CommandHandler("data", self.updateData))
-        print(2)
-        self.app.run_polling(
+        await self.app.initialize()
+        self._bot_send = self.app.bot.send_message
+        await self.app.updater.start_polling(
             drop_pending_updates=True,
-            allowed_updates=telegram.Update.ALL_TYPES,
-            timeout=10,
+            allowed_updates=_ALL_UPDATES,
+            timeout=20,
             bootstrap_retries=0,
         )
-        print("Polling started")
-
-    # async def __run(
-    #     self,
-    #     updater_coroutine: Coroutine,
-    #     stop_signals: telegram._utils.types.ODVInput[Sequence[int]],
-    #     bootstrap_retries: int,
-    #     close_loop: bool = True,
-    # ) -> None:
-    #     if (
-    #         stop_signals is telegram._utils.defaultvalue.DEFAULT_NONE
-    #         and platform.system() != "Windows"
-    #     ):
-    #         stop_signals = (signal.SIGINT, signal.SIGTERM, signal.SIGABRT)
-    #     self.logger.warning(
-    #         "Skipping adding signal handlers for the stop signals.",
-    #         stacklevel=3,
-    #     )
-    #     try:
-    #         await self.app._bootstrap_initialize(max_retries=bootstrap_retries)
-    #         # print("3")
-    #         if self.app.post_init:
-    #             await self.app.post_init(self)
-    #             # print("5")
-    #         # if self.app.__stop_running_marker.is_set():
-    #         #     self.app._LOGGER.info("Application received stop signal via `stop_running`. Shutting down.")
-    #         #     return
-    #         await updater_coroutine  # one of updater.start_webhook/polling
-    #         # print("7")
-    #         await self.app.start()
-    #         # print("9")
-    #         while self.app.running:
-    #             pass
-    #     except (KeyboardInterrupt, SystemExit):
-    #         self.logger.info("Application received stop signal. Shutting down.")
-    #     finally:
-    #         # We arrive here either by catching the exceptions above or if the loop gets stopped
-    #         # In case the coroutine wasn't awaited, we don't need to bother the user with a warning
-    #         updater_coroutine.close()
-    #         try:
-    #             # Mypy doesn't know that we already check if updater is None
-    #             if self.app.updater.running:  # type: ignore[union-attr]
-    #                 await self.app.updater.stop()  # type: ignore[union-attr]
-    #             if self.app.running:
-    #                 await self.app.stop()  # type: ignore[union-attr]
-    #                 # post_stop should be called only if stop was called!
-    #                 if self.app.post_stop:
-    #                     await self.app.post_stop(self.app)
-    #             await self.app.shutdown()
-    #             if self.app.post_shutdown:
-    #                 await self.app.post_shutdown(self.app)
-    #         finally:
-    #             pass
+        await self.app.start()
+        self.logger.debug("Polling started")
+        await self._stop_event.wait()
 
     async def exit(self):
-        await self.app.stop()
+        if self.app.updater and self.app.updater.running:
+            await self.app.updater.stop()
+        if self.app.running:
+            await self.app.stop()
+        await self.app.shutdown()
+        self._stop_event.set()
         self.running = False
 
     def health_check(self):
@@ -1,13 +1,12 @@
 import crosschat
 import discordPlatform
 import telegramPlatform
+import tokens
 from rich import print
 
 
-with open("./tokens/discord", "r") as f:
-    discordBotToken = f.read().strip()
-with open("./tokens/tg", "r") as f:
-    telegramBotToken = f.read().strip()
+discordBotToken = tokens.get("discord")
+telegramBotToken = tokens.get("tg")
 
 app = crosschat.CrossChat()
 print(app)
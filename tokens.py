@@ -0,0 +1,17 @@
+import functools
+import pathlib
+
+
+@functools.lru_cache
+def get(name: str) -> str:
+    """
+    Reads a token from the ./tokens directory, caching it so repeated
+    lookups across scripts in one process cost no further syscalls.
+
+    Args:
+        name (str): The token file name, e.g. "discord" or "tg".
+
+    Returns:
+        str: The token with surrounding whitespace stripped.
+    """
+    return pathlib.Path(f"./tokens/{name}").read_text().strip()